@@ -0,0 +1,73 @@
+"""
+FEATURE STORE CHECK – Job Acceptance Project
+-------------------------------------------
+Builds the feature store in two batches (with modified and
+duplicated rows) and compares the merged view against a one-shot
+feature_engineering run on the same input.
+"""
+
+import tempfile
+import pandas as pd
+
+from feature_engineering import (
+    feature_engineering,
+    fit_fill_values,
+    fit_vocabularies,
+)
+from feature_store import (
+    compact_feature_store,
+    load_feature_store,
+    load_manifest,
+    update_feature_store,
+)
+
+
+def check_incremental_matches_rebuild(df_raw, n_modified=5):
+    # --------------------------------------------------
+    # Batch 1: first 80% of rows
+    # Batch 2: all rows, a few modified, one duplicated
+    # --------------------------------------------------
+    batch1 = df_raw.iloc[: int(len(df_raw) * 0.8)].reset_index(drop=True)
+
+    batch2 = df_raw.copy().reset_index(drop=True)
+    batch2.loc[: n_modified - 1, "technical_score"] += 1
+    batch2 = pd.concat([batch2, batch2.iloc[[0]]], ignore_index=True)
+
+    # --------------------------------------------------
+    # One-shot run with the fills / vocabularies frozen on batch 1
+    # --------------------------------------------------
+    expected = feature_engineering(
+        batch2.copy(),
+        fill_values=fit_fill_values(batch1),
+        vocabularies=fit_vocabularies(batch1),
+    )
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        update_feature_store(batch1.copy(), store_dir)
+        update_feature_store(batch2.copy(), store_dir)
+
+        expected = expected.reindex(
+            columns=load_manifest(store_dir)["columns"], fill_value=0
+        )
+
+        df_view = load_feature_store(store_dir)
+        pd.testing.assert_frame_equal(df_view, expected)
+        print("✅ Incremental view matches one-shot rebuild")
+
+        compact_feature_store(store_dir)
+        df_view = load_feature_store(store_dir)
+        pd.testing.assert_frame_equal(df_view, expected)
+        print("✅ Compacted view matches one-shot rebuild")
+
+
+# --------------------------------------------------
+# MAIN EXECUTION
+# --------------------------------------------------
+if __name__ == "__main__":
+
+    RAW_DATA_PATH = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/HR_Job_Placement_Dataset.csv"
+
+    print("📥 Loading raw data...")
+    df_raw = pd.read_csv(RAW_DATA_PATH)
+
+    check_incremental_matches_rebuild(df_raw)
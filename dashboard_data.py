@@ -0,0 +1,65 @@
+import os
+import pandas as pd
+
+from feature_store import MANIFEST_FILE, load_feature_store, load_manifest
+
+BASE_DIR = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance"
+FEATURES_PATH = os.path.join(BASE_DIR, "job_acceptance_features.csv")
+STORE_DIR = os.path.join(BASE_DIR, "feature_store")
+DASHBOARD_SUMMARY_PATH = os.path.join(BASE_DIR, "dashboard_summary.csv")
+TARGET_COL = "status"
+
+
+def dashboard_summary(df, target_col=TARGET_COL):
+    """Metrics shown on the Job Acceptance dashboard"""
+    placed = df[target_col]
+    if placed.dtype == "object":
+        placed = placed.map({"placed": 1, "not placed": 0})
+
+    return {
+        "total_candidates": len(df),
+        "acceptance_rate_pct": round(placed.mean() * 100, 2),
+    }
+
+
+def save_dashboard_summary(summary, path=DASHBOARD_SUMMARY_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pd.DataFrame([summary]).to_csv(path, index=False)
+
+
+def load_dashboard_summary(path=DASHBOARD_SUMMARY_PATH):
+    row = pd.read_csv(path).iloc[0]
+    return {
+        "total_candidates": int(row["total_candidates"]),
+        "acceptance_rate_pct": float(row["acceptance_rate_pct"]),
+    }
+
+
+def feature_data_path():
+    """File whose change marks new feature data: store manifest or CSV"""
+    manifest_path = os.path.join(STORE_DIR, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        return manifest_path
+    return FEATURES_PATH
+
+
+def load_feature_data():
+    """Feature-engineered data: merged store view, else the features CSV"""
+    if load_manifest(STORE_DIR) is not None:
+        return load_feature_store(STORE_DIR)
+    return pd.read_csv(FEATURES_PATH)
+
+
+def get_dashboard_summary(path=DASHBOARD_SUMMARY_PATH):
+    """
+    Saved summary if it is at least as new as the feature data,
+    otherwise computed from the feature data.
+    """
+    source = feature_data_path()
+    if os.path.exists(path) and (
+        not os.path.exists(source)
+        or os.path.getmtime(path) >= os.path.getmtime(source)
+    ):
+        return load_dashboard_summary(path)
+
+    return dashboard_summary(load_feature_data())
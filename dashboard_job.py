@@ -1,9 +1,10 @@
 import streamlit as st
-import pandas as pd
+from dashboard_data import get_dashboard_summary
 
 st.title("🎯 Job Acceptance Prediction Dashboard")
 
-df = pd.read_csv("data/processed/job_acceptance_clean.csv")
+# Same feature data (and summary file) the pipeline uses
+summary = get_dashboard_summary()
 
-st.metric("Total Candidates", len(df))
-st.metric("Job Acceptance Rate (%)", round(df["placement_status"].mean()*100, 2))
+st.metric("Total Candidates", summary["total_candidates"])
+st.metric("Job Acceptance Rate (%)", summary["acceptance_rate_pct"])
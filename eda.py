@@ -1,13 +1,16 @@
 """
 EDA MODULE – Job Acceptance Project
 ----------------------------------
-Robust, screen-displayed EDA with safe column checks
+Robust, screen-displayed (or file-saved) EDA with safe column checks
 """
 
+import os
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from feature_store import load_feature_store, load_manifest
+
 sns.set(style="whitegrid")
 
 
@@ -20,7 +23,21 @@ def safe_group_mean(df, group_col, value_col):
         return None
 
 
-def run_eda(df, target_col="status"):
+def show_plot(name, output_dir=None):
+    """Show the current plot, or save it as <name>.png in output_dir"""
+    if output_dir is None:
+        plt.show()
+    else:
+        path = os.path.join(output_dir, f"{name}.png")
+        plt.savefig(path, bbox_inches="tight")
+        plt.close()
+        print(f"🖼️ Plot saved: {path}\n")
+
+
+def run_eda(df, target_col="status", output_dir=None):
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
 
     print("\n==============================")
     print("📊 EDA STARTED")
@@ -46,7 +63,7 @@ def run_eda(df, target_col="status"):
 
     academic_summary.plot(kind="bar", title="Academic Avg vs Placement")
     plt.ylabel("Academic Avg")
-    plt.show()
+    show_plot("academic_avg_vs_placement", output_dir)
 
     # --------------------------------------------------
     # 2️⃣ Skills Match vs Interview Performance
@@ -58,7 +75,7 @@ def run_eda(df, target_col="status"):
     plt.title("Skills Match vs Interview Performance")
     plt.xlabel("Skills Match %")
     plt.ylabel("Interview Avg Score")
-    plt.show()
+    show_plot("skills_vs_interview", output_dir)
 
     # --------------------------------------------------
     # 3️⃣ Certification Impact on Job Acceptance
@@ -69,7 +86,7 @@ def run_eda(df, target_col="status"):
         print(cert_rate, "\n")
         cert_rate.plot(kind="bar", title="Certification Impact")
         plt.ylabel("Acceptance Rate")
-        plt.show()
+        show_plot("certification_impact", output_dir)
 
     # --------------------------------------------------
     # 4️⃣ Acceptance Rate by Company Tier (Optional)
@@ -80,7 +97,7 @@ def run_eda(df, target_col="status"):
         print(tier_rate, "\n")
         tier_rate.plot(kind="bar", title="Acceptance by Company Tier")
         plt.ylabel("Acceptance Rate")
-        plt.show()
+        show_plot("company_tier_acceptance", output_dir)
 
     # --------------------------------------------------
     # 5️⃣ Experience vs Placement Success
@@ -91,7 +108,7 @@ def run_eda(df, target_col="status"):
         print(exp_rate, "\n")
         exp_rate.plot(kind="bar", title="Experience vs Placement")
         plt.ylabel("Acceptance Rate")
-        plt.show()
+        show_plot("experience_vs_placement", output_dir)
 
     # --------------------------------------------------
     # 6️⃣ Competition Level Impact
@@ -102,7 +119,7 @@ def run_eda(df, target_col="status"):
         print(comp_rate, "\n")
         comp_rate.plot(kind="bar", title="Competition Impact")
         plt.ylabel("Acceptance Rate")
-        plt.show()
+        show_plot("competition_impact", output_dir)
 
     # --------------------------------------------------
     # 7️⃣ Interview Score vs Placement Probability
@@ -115,7 +132,7 @@ def run_eda(df, target_col="status"):
     plt.title("Interview Score vs Placement Probability")
     plt.xlabel("Interview Score Avg")
     plt.ylabel("Placement Probability")
-    plt.show()
+    show_plot("interview_vs_probability", output_dir)
 
     # --------------------------------------------------
     # 8️⃣ Employability Test Score Analysis
@@ -130,7 +147,7 @@ def run_eda(df, target_col="status"):
 
     employ_summary.plot(kind="bar", title="Employability Score vs Placement")
     plt.ylabel("Employability Score")
-    plt.show()
+    show_plot("employability_score", output_dir)
 
     # --------------------------------------------------
     # 9️⃣ Dropout Risk Identification
@@ -152,7 +169,7 @@ def run_eda(df, target_col="status"):
         print(gender_rate, "\n")
         gender_rate.plot(kind="bar", title="Gender-wise Acceptance")
         plt.ylabel("Acceptance Rate")
-        plt.show()
+        show_plot("gender_acceptance", output_dir)
 
     print("✅ EDA COMPLETED SUCCESSFULLY\n")
 
@@ -163,9 +180,13 @@ def run_eda(df, target_col="status"):
 if __name__ == "__main__":
 
     DATA_PATH = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/job_acceptance_features.csv"
+    STORE_DIR = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/feature_store"
 
     print("📥 Loading data...")
-    df = pd.read_csv(DATA_PATH)
+    if load_manifest(STORE_DIR) is not None:
+        df = load_feature_store(STORE_DIR)
+    else:
+        df = pd.read_csv(DATA_PATH)
 
     print("📊 Running EDA...\n")
     run_eda(df)
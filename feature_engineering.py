@@ -1,22 +1,79 @@
 import pandas as pd
 
 
-def feature_engineering(df, target_col="status"):
+FINAL_CAT_COLS = [
+    "gender", "degree_specialization", "internship_experience",
+    "career_switch_willingness", "relevant_experience", "company_tier",
+    "job_role_match", "competition_level", "bond_requirement",
+    "layoff_history", "relocation_willingness",
+    "experience_level", "skills_level",
+    "academic_performance_band", "interview_performance_category"
+]
+
+
+def fit_fill_values(df):
+    """
+    Learns the missing-value fills used by feature_engineering:
+    median for numeric columns, mode for text columns.
+    """
+    fill_values = {}
+
+    num_cols = df.select_dtypes(include="number").columns
+    fill_values.update(df[num_cols].median().to_dict())
+
+    cat_cols = df.select_dtypes(include="object").columns
+    for col in cat_cols:
+        fill_values[col] = df[col].mode()[0]
+
+    return fill_values
+
+
+def fit_vocabularies(df):
+    """
+    Learns the category list of every raw one-hot encoded column.
+    Binned columns (experience_level, ...) have fixed labels
+    and are not included.
+    """
+    vocabularies = {}
+
+    for col in FINAL_CAT_COLS:
+        if col not in df.columns:
+            continue
+        values = df[col].dropna()
+        if values.dtype == "object":
+            values = values.str.strip().str.lower()
+        vocabularies[col] = sorted(values.unique().tolist())
+
+    return vocabularies
+
+
+def feature_engineering(df, target_col="status", fill_values=None,
+                        vocabularies=None):
     """
     Performs data cleaning and feature engineering.
     Returns a fully feature-engineered DataFrame
     aligned with Step 5 of the project document.
+
+    fill_values / vocabularies freeze the missing-value fills and
+    one-hot categories (see fit_fill_values / fit_vocabularies) so a
+    small batch encodes exactly like the full history.
     """
 
     # -----------------------------
     # 1️⃣ Handle Missing Values
     # -----------------------------
+    if fill_values is None:
+        fill_values = fit_fill_values(df)
+
     num_cols = df.select_dtypes(include="number").columns
-    df[num_cols] = df[num_cols].fillna(df[num_cols].median())
+    df[num_cols] = df[num_cols].fillna(
+        {col: fill_values[col] for col in num_cols if col in fill_values}
+    )
 
     cat_cols = df.select_dtypes(include="object").columns
     for col in cat_cols:
-        df[col] = df[col].fillna(df[col].mode()[0])
+        if col in fill_values:
+            df[col] = df[col].fillna(fill_values[col])
         df[col] = df[col].str.strip().str.lower()
 
     # -----------------------------
@@ -95,18 +152,13 @@ def feature_engineering(df, target_col="status"):
     # -----------------------------
     # 🔟 One-Hot Encoding
     # -----------------------------
-    final_cat_cols = [
-        "gender", "degree_specialization", "internship_experience",
-        "career_switch_willingness", "relevant_experience", "company_tier",
-        "job_role_match", "competition_level", "bond_requirement",
-        "layoff_history", "relocation_willingness",
-        "experience_level", "skills_level",
-        "academic_performance_band", "interview_performance_category"
-    ]
+    if vocabularies is not None:
+        for col, categories in vocabularies.items():
+            df[col] = pd.Categorical(df[col], categories=categories)
 
     df_encoded = pd.get_dummies(
         df,
-        columns=final_cat_cols,
+        columns=FINAL_CAT_COLS,
         drop_first=True
     )
 
@@ -0,0 +1,241 @@
+"""
+FEATURE STORE – Job Acceptance Project
+-------------------------------------
+Incremental, append-only feature engineering keyed by row hash.
+
+Each run hashes the raw rows, engineers features only for rows that
+are new or changed, and appends them as a new partition. Fill
+values, one-hot vocabularies and the output column layout are
+frozen on the first run so every partition lines up. Once enough
+stored rows are superseded, the partitions are compacted into one.
+"""
+
+import os
+import pandas as pd
+import joblib
+
+from feature_engineering import (
+    feature_engineering,
+    fit_fill_values,
+    fit_vocabularies,
+)
+
+MANIFEST_FILE = "manifest.pkl"
+ROW_HASH_COL = "_row_hash"
+
+# Compact once this share of stored rows is no longer in the view
+COMPACT_STALE_FRACTION = 0.3
+
+
+def row_hashes(df):
+    """Stable per-row hash of the raw values (index ignored)"""
+    return pd.util.hash_pandas_object(df.astype(str), index=False)
+
+
+def load_manifest(store_dir):
+    """Returns the store manifest, or None if the store is empty"""
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    return joblib.load(path)
+
+
+def save_manifest(manifest, store_dir):
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    tmp_path = path + ".tmp"
+    joblib.dump(manifest, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def read_partition(store_dir, name):
+    return pd.read_csv(os.path.join(store_dir, name), dtype={ROW_HASH_COL: str})
+
+
+def next_partition_name(manifest):
+    part_name = f"part-{manifest['next_partition']:05d}.csv"
+    manifest["next_partition"] += 1
+    return part_name
+
+
+def stale_fraction(manifest):
+    """Share of stored rows that the merged view no longer uses"""
+    stored = manifest["stored_hashes"]
+    if not stored:
+        return 0.0
+    return len(stored - set(manifest["current_hashes"])) / len(stored)
+
+
+def compact_feature_store(store_dir):
+    """
+    Rewrites the store as a single partition holding only the rows
+    of the current view, and forgets the hashes of all other rows.
+    """
+    manifest = load_manifest(store_dir)
+    if manifest is None:
+        return
+
+    old_partitions = manifest["partitions"]
+    df = pd.concat(
+        [read_partition(store_dir, name) for name in old_partitions],
+        ignore_index=True,
+    )
+    df = df[df[ROW_HASH_COL].isin(manifest["current_hashes"])]
+
+    # Write the new partition and manifest before removing old files
+    part_name = next_partition_name(manifest)
+    df.to_csv(os.path.join(store_dir, part_name), index=False)
+
+    manifest["partitions"] = [part_name]
+    manifest["stored_hashes"] = set(df[ROW_HASH_COL])
+    save_manifest(manifest, store_dir)
+
+    for name in old_partitions:
+        os.remove(os.path.join(store_dir, name))
+
+    print(f"🗜️ Compacted {len(old_partitions)} partitions into {part_name} ({len(df)} rows)")
+
+
+def clear_feature_store(store_dir):
+    """Removes every partition and the manifest of a store"""
+    manifest = load_manifest(store_dir)
+    if manifest is None:
+        return
+
+    for name in manifest["partitions"]:
+        os.remove(os.path.join(store_dir, name))
+    os.remove(os.path.join(store_dir, MANIFEST_FILE))
+
+
+def warn_unseen_categories(df, vocabularies):
+    """Prints a warning for values outside the frozen vocabularies"""
+    for col, categories in vocabularies.items():
+        if col not in df.columns:
+            continue
+        values = df[col].dropna()
+        if values.dtype == "object":
+            values = values.str.strip().str.lower()
+        unseen = sorted(set(values.unique().tolist()) - set(categories))
+        if unseen:
+            print(
+                f"⚠️ '{col}' has values outside the frozen vocabulary: {unseen}\n"
+                "   They are encoded as the baseline category – "
+                "run with rebuild=True to refit."
+            )
+
+
+def update_feature_store(df_raw, store_dir, target_col="status", rebuild=False):
+    """
+    Appends features for rows whose hash is not in the store yet and
+    records the current row hashes (in order, duplicates included).
+    The merged view matches feature_engineering() on df_raw with the
+    frozen fills and vocabularies. That equals a full rebuild only
+    while they stay valid: new categories are encoded as the baseline
+    and fills are not refitted. rebuild=True clears the store and
+    refits them.
+    Returns the number of rows written.
+    """
+    os.makedirs(store_dir, exist_ok=True)
+
+    if rebuild:
+        print("🧹 Rebuilding feature store...")
+        clear_feature_store(store_dir)
+
+    df_raw = df_raw.reset_index(drop=True)
+    hashes = row_hashes(df_raw).astype(str)
+
+    manifest = load_manifest(store_dir)
+
+    # --------------------------------------------------
+    # First run → freeze fills, vocabularies and layout
+    # --------------------------------------------------
+    if manifest is None:
+        manifest = {
+            "fill_values": fit_fill_values(df_raw),
+            "vocabularies": fit_vocabularies(df_raw),
+            "columns": None,
+            "stored_hashes": set(),
+            "current_hashes": [],
+            "partitions": [],
+            "next_partition": 0,
+        }
+
+    # --------------------------------------------------
+    # Detect new / modified rows (one copy per hash)
+    # --------------------------------------------------
+    changed = ~hashes.isin(list(manifest["stored_hashes"])) & ~hashes.duplicated()
+    df_changed = df_raw[changed].copy()
+
+    written = 0
+    if not df_changed.empty:
+        print(f"⚙️ Engineering features for {len(df_changed)} new/modified rows...")
+        warn_unseen_categories(df_changed, manifest["vocabularies"])
+
+        df_features = feature_engineering(
+            df_changed,
+            target_col=target_col,
+            fill_values=manifest["fill_values"],
+            vocabularies=manifest["vocabularies"],
+        )
+
+        if manifest["columns"] is None:
+            manifest["columns"] = list(df_features.columns)
+        df_features = df_features.reindex(columns=manifest["columns"], fill_value=0)
+        df_features[ROW_HASH_COL] = hashes[changed].values
+
+        # Append partition before the manifest points at it
+        part_name = next_partition_name(manifest)
+        df_features.to_csv(os.path.join(store_dir, part_name), index=False)
+
+        manifest["partitions"].append(part_name)
+        manifest["stored_hashes"].update(hashes[changed])
+        written = len(df_features)
+        print(f"✅ Appended {written} rows as {part_name}")
+    elif not manifest["partitions"]:
+        # Nothing to freeze a layout from – leave the store empty
+        print("⚠️ No rows to store – feature store not created")
+        return 0
+    else:
+        print("✅ Feature store up to date – nothing to append")
+
+    # Rows changed or removed since the last run drop out of the view
+    manifest["current_hashes"] = hashes.tolist()
+    save_manifest(manifest, store_dir)
+
+    if stale_fraction(manifest) > COMPACT_STALE_FRACTION:
+        compact_feature_store(store_dir)
+
+    return written
+
+
+def load_feature_store(store_dir):
+    """
+    Merged view of the store: one row per current raw row, in raw
+    order and frozen column layout (bookkeeping columns dropped).
+    """
+    manifest = load_manifest(store_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No feature store found in: {store_dir}")
+
+    parts = [read_partition(store_dir, name) for name in manifest["partitions"]]
+    df = pd.concat(parts, ignore_index=True).set_index(ROW_HASH_COL)
+
+    df = df.loc[manifest["current_hashes"]]
+
+    return df[manifest["columns"]].reset_index(drop=True)
+
+
+# --------------------------------------------------
+# MAIN EXECUTION
+# --------------------------------------------------
+if __name__ == "__main__":
+
+    RAW_DATA_PATH = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/HR_Job_Placement_Dataset.csv"
+    STORE_DIR = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/feature_store"
+
+    print("📥 Loading raw data...")
+    df_raw = pd.read_csv(RAW_DATA_PATH)
+
+    update_feature_store(df_raw, STORE_DIR)
+
+    df_view = load_feature_store(STORE_DIR)
+    print("📐 Merged feature view:", df_view.shape)
@@ -12,6 +12,8 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 from sklearn.ensemble import RandomForestClassifier
 
+from feature_store import load_feature_store, load_manifest
+
 # ---------------------------------------------
 # 1️⃣ Load Dataset (SAFE PATH HANDLING)
 # ---------------------------------------------
@@ -20,8 +22,12 @@ print("🔹 Model Training Started")
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(BASE_DIR, "job_acceptance_features.csv")
+STORE_DIR = os.path.join(BASE_DIR, "feature_store")
 
-df = pd.read_csv(DATA_PATH)
+if load_manifest(STORE_DIR) is not None:
+    df = load_feature_store(STORE_DIR)
+else:
+    df = pd.read_csv(DATA_PATH)
 
 print("✅ Dataset loaded successfully")
 
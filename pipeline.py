@@ -0,0 +1,233 @@
+"""
+PIPELINE MODULE – Job Acceptance Project
+---------------------------------------
+Runs the project stages as a dependency graph. Stages whose inputs
+are ready run concurrently on a thread pool; artifacts are passed
+in memory. Prints the critical path and per-stage utilization.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import matplotlib
+import pandas as pd
+
+from dashboard_data import dashboard_summary, save_dashboard_summary
+from data_cleaning import clean_data
+from eda import run_eda
+from feature_store import update_feature_store, load_feature_store
+from model_evaluation import train_and_evaluate
+from preprocessing import preprocess_data, save_artifacts
+from save_to_sql import save_to_sql
+
+BASE_DIR = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance"
+RAW_DATA_PATH = os.path.join(BASE_DIR, "HR_Job_Placement_Dataset.csv")
+CLEAN_DATA_PATH = os.path.join(BASE_DIR, "cleaned_data.csv")
+STORE_DIR = os.path.join(BASE_DIR, "feature_store")
+ARTIFACTS_DIR = os.path.join(BASE_DIR, "artifacts")
+EDA_DIR = os.path.join(BASE_DIR, "eda_plots")
+TARGET_COL = "status"
+
+
+# --------------------------------------------------
+# STAGES
+# Each stage receives {dependency_name: artifact}
+# and returns its own artifact. Artifacts are shared
+# between threads, so stages work on a .copy().
+# --------------------------------------------------
+def load_stage(inputs):
+    return pd.read_csv(RAW_DATA_PATH)
+
+
+def clean_stage(inputs):
+    # Only writes cleaned_data.csv for the Streamlit app; the feature
+    # store cleans raw rows itself with its frozen fill values.
+    df_cleaned = clean_data(inputs["load"].copy())
+    df_cleaned.to_csv(CLEAN_DATA_PATH, index=False)
+    return df_cleaned
+
+
+def features_stage(inputs):
+    update_feature_store(inputs["load"].copy(), STORE_DIR, target_col=TARGET_COL)
+    return load_feature_store(STORE_DIR)
+
+
+def eda_stage(inputs):
+    run_eda(inputs["features"].copy(), target_col=TARGET_COL, output_dir=EDA_DIR)
+
+
+def sql_stage(inputs):
+    save_to_sql(inputs["features"].copy())
+
+
+def dashboard_stage(inputs):
+    summary = dashboard_summary(inputs["features"].copy(), target_col=TARGET_COL)
+    save_dashboard_summary(summary)
+    print("📈 Dashboard summary:", summary)
+    return summary
+
+
+def preprocess_stage(inputs):
+    X_scaled, y, scaler, feature_names = preprocess_data(inputs["features"].copy(), TARGET_COL)
+    save_artifacts(ARTIFACTS_DIR, X_scaled, y, scaler, feature_names)
+    return X_scaled, y
+
+
+def train_stage(inputs):
+    X, y = inputs["preprocess"]
+    model_path = os.path.join(ARTIFACTS_DIR, "job_acceptance_model.pkl")
+    return train_and_evaluate(X, y, model_path)
+
+
+# name → (function, dependencies)
+STAGES = {
+    "load": (load_stage, []),
+    "clean": (clean_stage, ["load"]),
+    "features": (features_stage, ["load"]),
+    "eda": (eda_stage, ["features"]),
+    "sql": (sql_stage, ["features"]),
+    "dashboard": (dashboard_stage, ["features"]),
+    "preprocess": (preprocess_stage, ["features"]),
+    "train": (train_stage, ["preprocess"]),
+}
+
+
+# --------------------------------------------------
+# RUNNER
+# --------------------------------------------------
+def _check_dag(stages):
+    """Raises ValueError on unknown dependencies or cycles"""
+    for name, (_, deps) in stages.items():
+        for dep in deps:
+            if dep not in stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+
+    visiting, done = set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through stage '{name}'")
+        visiting.add(name)
+        for dep in stages[name][1]:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in stages:
+        visit(name)
+
+
+def run_pipeline(stages=STAGES, max_workers=4):
+    """
+    Runs every stage once its dependencies have finished.
+    Switches matplotlib to the non-interactive Agg backend.
+    A failed stage only skips the stages downstream of it.
+    Returns (artifacts, timings, failures) where timings maps
+    stage → (start, end) in seconds since the run started and
+    failures maps stage → exception, or "skipped".
+    """
+    _check_dag(stages)
+
+    # pyplot only supports worker threads with a non-interactive
+    # backend; stages save their plots to files instead.
+    matplotlib.use("Agg")
+
+    artifacts, timings, failures = {}, {}, {}
+    pending = dict(stages)
+    running = {}
+    t0 = time.perf_counter()
+
+    def timed(name, func, inputs):
+        start = time.perf_counter() - t0
+        try:
+            return func(inputs)
+        finally:
+            timings[name] = (start, time.perf_counter() - t0)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            # Skip stages behind a failure, submit those whose inputs are ready
+            for name, (func, deps) in list(pending.items()):
+                if any(dep in failures for dep in deps):
+                    print(f"⏭️ Skipping stage: {name} (upstream failed)")
+                    failures[name] = "skipped"
+                    del pending[name]
+                elif all(dep in artifacts for dep in deps):
+                    inputs = {dep: artifacts[dep] for dep in deps}
+                    print(f"▶️ Starting stage: {name}")
+                    running[pool.submit(timed, name, func, inputs)] = name
+                    del pending[name]
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                start, end = timings[name]
+                try:
+                    artifacts[name] = future.result()
+                except Exception as exc:
+                    print(f"❌ Stage failed: {name} ({end - start:.2f}s): {exc!r}")
+                    failures[name] = exc
+                    continue
+                print(f"✅ Finished stage: {name} ({end - start:.2f}s)")
+
+    return artifacts, timings, failures
+
+
+def critical_path(stages, timings):
+    """Longest chain of stage durations through the stages that ran"""
+    longest = {}
+
+    def chain(name):
+        if name not in longest:
+            start, end = timings[name]
+            deps = stages[name][1]
+            best = max((chain(dep) for dep in deps), key=lambda c: c[0], default=(0.0, []))
+            longest[name] = (best[0] + end - start, best[1] + [name])
+        return longest[name]
+
+    return max((chain(name) for name in timings), key=lambda c: c[0])
+
+
+def report(stages, timings, max_workers, failures=None):
+    wall = max(end for _, end in timings.values())
+    busy = sum(end - start for start, end in timings.values())
+
+    print("\n==============================")
+    print("⏱️ PIPELINE REPORT")
+    print("==============================\n")
+
+    print(f"{'stage':<12}{'start':>8}{'end':>8}{'time':>8}{'util':>8}")
+    for name, (start, end) in sorted(timings.items(), key=lambda kv: kv[1][0]):
+        print(f"{name:<12}{start:>8.2f}{end:>8.2f}{end - start:>8.2f}{(end - start) / wall:>8.1%}")
+
+    length, path = critical_path(stages, timings)
+    print(f"\n🧭 Critical path ({length:.2f}s): {' → '.join(path)}")
+    print(f"🕒 Wall time: {wall:.2f}s (sequential: {busy:.2f}s)")
+    print(f"⚙️ Pool utilization: {busy / (wall * max_workers):.1%} of {max_workers} workers\n")
+
+    if failures:
+        print("❌ Failed / skipped stages:")
+        for name, reason in failures.items():
+            print(f"   {name}: {reason if reason == 'skipped' else repr(reason)}")
+        print()
+
+
+# --------------------------------------------------
+# MAIN EXECUTION
+# --------------------------------------------------
+if __name__ == "__main__":
+    MAX_WORKERS = 4
+
+    print(f"🖼️ EDA plots will be saved to: {EDA_DIR}")
+
+    artifacts, timings, failures = run_pipeline(STAGES, max_workers=MAX_WORKERS)
+    report(STAGES, timings, MAX_WORKERS, failures)
+
+    if failures:
+        raise SystemExit(1)
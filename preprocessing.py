@@ -3,6 +3,8 @@ from sklearn.preprocessing import StandardScaler
 import joblib
 import os
 
+from feature_store import load_feature_store, load_manifest
+
 
 def preprocess_data(df, target_col):
     # Split features and target
@@ -19,21 +21,33 @@ def preprocess_data(df, target_col):
     return X_scaled, y, scaler, X_encoded.columns
 
 
+def save_artifacts(output_dir, X_scaled, y, scaler, feature_names):
+    os.makedirs(output_dir, exist_ok=True)
+
+    joblib.dump(X_scaled, os.path.join(output_dir, "X_processed.pkl"))
+    joblib.dump(y, os.path.join(output_dir, "y.pkl"))
+    joblib.dump(scaler, os.path.join(output_dir, "scaler.pkl"))
+    joblib.dump(feature_names, os.path.join(output_dir, "feature_names.pkl"))
+
+
 def main():
     # ---------------------------
     # CONFIG
     # ---------------------------
     DATA_PATH = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/job_acceptance_features.csv"
+    STORE_DIR = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/feature_store"
     TARGET_COL = "status"
 
     OUTPUT_DIR = r"C:/Users/2SIN/Documents/Python/venv/Job_Acceptance/artifacts"
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # ---------------------------
     # FETCH DATA
     # ---------------------------
     print("📥 Fetching data...")
-    df = pd.read_csv(DATA_PATH)
+    if load_manifest(STORE_DIR) is not None:
+        df = load_feature_store(STORE_DIR)
+    else:
+        df = pd.read_csv(DATA_PATH)
 
     # ---------------------------
     # PREPROCESS DATA
@@ -44,10 +58,7 @@ def main():
     # ---------------------------
     # SAVE OUTPUTS (PKL FILES)
     # ---------------------------
-    joblib.dump(X_scaled, os.path.join(OUTPUT_DIR, "X_processed.pkl"))
-    joblib.dump(y, os.path.join(OUTPUT_DIR, "y.pkl"))
-    joblib.dump(scaler, os.path.join(OUTPUT_DIR, "scaler.pkl"))
-    joblib.dump(feature_names, os.path.join(OUTPUT_DIR, "feature_names.pkl"))
+    save_artifacts(OUTPUT_DIR, X_scaled, y, scaler, feature_names)
 
     print("✅ Outputs saved in:", OUTPUT_DIR)
 